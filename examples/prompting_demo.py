@@ -0,0 +1,95 @@
+from enum import Enum
+from typing import Literal, Union
+
+from pydantic import BaseModel, Field
+
+from llmxml.prompting import generate_example, generate_prompt_template
+
+
+class CreateAction(BaseModel):
+    action_type: Literal["create"] = Field(
+        ..., description="The type of action to perform"
+    )
+    new_file_path: str = Field(..., description="The path to the new file to create")
+    file_contents: str = Field(
+        ..., description="The contents of the new file to create"
+    )
+
+
+class EditAction(BaseModel):
+    action_type: Literal["edit"] = Field(...)
+    original_file_path: str = Field(
+        ..., description="The path to the original file to edit"
+    )
+    new_file_contents: str = Field(..., description="The contents of the edited file")
+
+
+class CommandAction(BaseModel):
+    action_type: Literal["command"] = Field(
+        ..., description="The type of action to perform"
+    )
+    command: str = Field(..., description="The command to run")
+
+
+class Action(BaseModel):
+    thinking: str = Field(default="", description="The thinking to perform")
+    actions: list[Union[CreateAction, EditAction, CommandAction]] = Field(
+        default_factory=list, description="The actions to perform"
+    )
+
+
+# Prompt template for a model with a list of union actions
+print(generate_prompt_template(Action))
+
+action = Action(
+    thinking="First, I need to create a new configuration file. Then, I'll modify an existing source file to use the new configuration.",
+    actions=[
+        CreateAction(
+            action_type="create",
+            new_file_path="config/settings.json",
+            file_contents='interface Config { apiKey: string; baseUrl: string; timeout: number; } const config: Config = { apiKey: "your-api-key-here", baseUrl: "https://api.example.com", timeout: 30 };',
+        ),
+        EditAction(
+            action_type="edit",
+            original_file_path="src/main.py",
+            new_file_contents='import json\n\ndef load_config():\n    with open("config/settings.json", "r") as f:\n        return json.load(f)\n\ndef main():\n    config = load_config()\n    print(f"Connecting to {config[\'baseUrl\']}...")\n\nif __name__ == "__main__":\n    main()',
+        ),
+    ],
+)
+
+# Example output built from an instance
+print(generate_example(action))
+
+
+class SomeField(Enum):
+    A = "A"
+    B = "B"
+
+
+class ExampleResponse(BaseModel):
+    response: list[SomeField] = Field(..., description="The response to the query")
+
+
+print(generate_example(ExampleResponse(response=[SomeField.A, SomeField.B])))
+print(generate_prompt_template(ExampleResponse))
+
+
+class Movie(BaseModel):
+    title: str = Field(..., description="The title of the movie")
+    director: str = Field(..., description="The director of the movie")
+
+
+class Response(BaseModel):
+    movies: list[Movie] = Field(
+        ..., description="A list of movies that match the query"
+    )
+
+
+class ResponseObject(BaseModel):
+    response: Response = Field(
+        ..., description="The response object that contains the movies"
+    )
+
+
+# Prompt template for nested models
+print(generate_prompt_template(ResponseObject))
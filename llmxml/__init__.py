@@ -1,5 +1,12 @@
-from .parser import parse_xml
+from .parser import IncrementalParser, parse_xml
 from .patch import from_anthropic, from_openai
-from .prompts import generate_prompt_template
+from .prompting import PromptedModel, generate_prompt_template
 
-__all__ = ["parse_xml", "generate_prompt_template", "from_openai", "from_anthropic"]
+__all__ = [
+    "parse_xml",
+    "IncrementalParser",
+    "generate_prompt_template",
+    "PromptedModel",
+    "from_openai",
+    "from_anthropic",
+]
@@ -1,6 +1,9 @@
+import codecs
 import re
+import sys
 import types
 from enum import Enum
+from functools import lru_cache
 from types import NoneType
 from typing import Any, Type, TypeVar, Union, get_args, get_origin
 
@@ -8,6 +11,16 @@ from pydantic import BaseModel, create_model
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
+_CAMEL_RE = re.compile(r"(?!^)([A-Z]+)")
+
+# Appended to streamed content to find which text value its trailing text belongs to.
+_OPEN_TEXT_SENTINEL = "\x00llmxml-open-text\x00"
+
+# Model classes whose type dictionaries are kept. A type dictionary holds its model
+# class (and nested ones) under "origin", so a weakly keyed cache could never drop it;
+# the cache is a bounded LRU instead, and a class stays alive until it is evicted.
+_TYPE_DICT_CACHE_SIZE: int = 256
+
 """
 XML Parsing Flow:
 1. parse_xml(xml, model) -> Entry point
@@ -26,13 +39,17 @@ XML Parsing Flow:
 """
 
 
+@lru_cache(maxsize=None)
 def _camel_to_snake(string: str) -> str:
     """
     Convert a camelCase string to a snake_case string.
     :param string: The string to convert
     :return: The converted string
     """
-    return re.sub("(?!^)([A-Z]+)", r"_\1", string).lower()
+    # Names without inner capitals (e.g. "Movie") need no substitution
+    if string[1:].islower():
+        return sys.intern(string.lower())
+    return sys.intern(_CAMEL_RE.sub(r"_\1", string).lower())
 
 
 def _inspect_type_annotation(annotation, name: str = "") -> dict:
@@ -105,6 +122,17 @@ def _inspect_type_annotation(annotation, name: str = "") -> dict:
     }
 
 
+@lru_cache(maxsize=_TYPE_DICT_CACHE_SIZE)
+def _model_type_dict(model: Type[BaseModel]) -> dict:
+    """
+    Get the type dictionary of a model, inspected once per model class. Parsing only
+    adds memoized lookup tables to it, so it is shared.
+    :param model: The Pydantic model to inspect
+    :return: The type dictionary from inspect_type_annotation
+    """
+    return _inspect_type_annotation(model)
+
+
 def _get_all_possible_tags(type_dict: dict) -> set[str]:
     """
     Recursively get all possible tag names from a type dictionary.
@@ -199,6 +227,44 @@ def _get_possible_opening_tags(type_dict: dict, seen_tags: set[str] = set()) ->
     return {k: v for k, v in combined.items() if k not in seen_tags}
 
 
+def _child_opening_tags(open_arg: dict) -> dict:
+    """
+    Get the tags that can open a child of the given type dictionary, keyed by tag name.
+    Union members are keyed by their own tag, so each child is dispatched to its
+    member type with a single lookup. The table is built once per type dictionary.
+    :param open_arg: The type dictionary of the enclosing tag
+    :return: The possible child opening tags
+    """
+    opening_tags: dict | None = open_arg.get("opening_tags")
+    if opening_tags is None:
+        opening_tags = _get_possible_opening_tags(open_arg, {open_arg.get("name", "")})
+        open_arg["opening_tags"] = opening_tags
+    return opening_tags
+
+
+def _tag_pattern(open_arg: dict) -> re.Pattern:
+    """
+    Get the compiled pattern matching either a child opening tag (group "open") or the
+    closing tag of a type dictionary (group "close"), so a single search finds
+    whichever comes first. Built once per type dictionary.
+    :param open_arg: The type dictionary of the enclosing tag
+    :return: The compiled tag pattern
+    """
+    pattern: re.Pattern | None = open_arg.get("tag_pattern")
+    if pattern is None:
+        close_tag_pattern: str = f"/(?P<close>{open_arg['name']})"
+        opening_tags: dict = _child_opening_tags(open_arg)
+        if opening_tags:
+            open_tag_pattern: str = "|".join(opening_tags.keys())
+            pattern = re.compile(
+                f"<(?:(?P<open>{open_tag_pattern})|{close_tag_pattern})>"
+            )
+        else:
+            pattern = re.compile(f"<{close_tag_pattern}>")
+        open_arg["tag_pattern"] = pattern
+    return pattern
+
+
 def _get_default_for_primitive(arg: dict) -> Union[str, int, float, bool, None]:
     """
     Get the default value for a primitive type.
@@ -327,9 +393,7 @@ def _recurse(
     :param pos: The current position in the XML content
     :return: A tuple of (parsed content, new position, has_content)
     """
-    possible_next_opening_tags: dict = _get_possible_opening_tags(
-        open_arg, {open_arg.get("name", "")}
-    )
+    possible_next_opening_tags: dict = _child_opening_tags(open_arg)
 
     attribute_dict: dict = {}
     attribute_list: list = []
@@ -338,20 +402,13 @@ def _recurse(
     if _is_list_type(open_arg["origin"]):
         attribute_dict[open_arg["name"]] = []
 
-    while pos < len(xml_content):
-        # Find next opening and closing tags
-        open_tag_pattern: str = "|".join(possible_next_opening_tags.keys())
-        opening_tag_regex: re.Pattern = re.compile(f"<({open_tag_pattern})>")
-        opening_match: Union[re.Match, None] = opening_tag_regex.search(
-            xml_content, pos
-        )
-        if not possible_next_opening_tags:
-            opening_match = None
+    tag_regex: re.Pattern = _tag_pattern(open_arg)
 
-        close_tag_regex: re.Pattern = re.compile(f"</({open_arg['name']})>")
-        closing_match: Union[re.Match, None] = close_tag_regex.search(xml_content, pos)
+    while pos < len(xml_content):
+        # Find the next child opening tag or closing tag, whichever comes first
+        tag_match: Union[re.Match, None] = tag_regex.search(xml_content, pos)
 
-        if not opening_match and not closing_match:
+        if not tag_match:
             return _handle_no_matches(
                 xml_content,
                 open_arg,
@@ -360,13 +417,11 @@ def _recurse(
                 possible_next_opening_tags,
             )
 
-        if opening_match and (
-            not closing_match or opening_match.start() < closing_match.start()
-        ):
+        if tag_match.lastgroup == "open":
             # Recurse into child tag
-            new_open_arg: dict = possible_next_opening_tags[opening_match.group(1)]
+            new_open_arg: dict = possible_next_opening_tags[tag_match.group("open")]
             dict_entry, new_pos, is_content = _recurse(
-                xml_content, new_open_arg, opening_match.end()
+                xml_content, new_open_arg, tag_match.end()
             )
             has_child_content |= is_content
 
@@ -376,14 +431,14 @@ def _recurse(
                 attribute_dict[new_open_arg["name"]] = dict_entry
 
             pos = new_pos
-        elif closing_match:
+        else:
             return _handle_closing_tag(
                 xml_content,
                 open_arg,
                 attribute_list,
                 attribute_dict,
                 pos,
-                closing_match,
+                tag_match,
             )
 
     if _is_list_type(open_arg["origin"]):
@@ -510,6 +565,17 @@ def _make_partial(model: Type[ModelType], data: dict[str, Any]) -> ModelType:
     return partial_model(**{k: v for k, (_, v) in new_fields.items() if v is not None})
 
 
+@lru_cache(maxsize=256)
+def _enum_members(enum_type: type[Enum]) -> tuple[Enum, ...]:
+    """
+    Get the members of an Enum in definition order, listed once per Enum class. At
+    most 256 Enum classes are kept.
+    :param enum_type: The Enum class
+    :return: The members of the Enum
+    """
+    return tuple(enum_type)
+
+
 def _convert_enum_content(enum_type: type[Enum], content: str) -> Enum | str | None:
     """
     Converts XML content to the correct Enum member if possible.
@@ -524,7 +590,7 @@ def _convert_enum_content(enum_type: type[Enum], content: str) -> Enum | str | N
     # Attempt 1-based indexing into the enum members
     try:
         idx = int(content) - 1
-        members = list(enum_type)
+        members = _enum_members(enum_type)
         return members[idx]  # Return the actual Enum member
     except (IndexError, ValueError):
         # If out of range or invalid integer, default to None (pydantic may raise validation error if required)
@@ -548,26 +614,218 @@ def _parse_xml(
     if failed_initial:
         xml_content: str = _clean_xml(xml_content)
 
+    return model(**_parse_dict(xml_content, type_dict))
+
+
+def _parse_dict(xml_content: str, type_dict: dict) -> dict:
+    """
+    Parse the XML content into a dictionary of field values, before validation.
+    :param xml_content: The XML content to parse
+    :param type_dict: The type dictionary from inspect_type_annotation
+    :return: The parsed dictionary with missing fields filled
+    """
     parsed_dict: dict
     parsed_dict, _, _ = _recurse(xml_content, type_dict, 0)
     if not parsed_dict:
         parsed_dict = {}
-    parsed_dict = _fill_with_empty(parsed_dict, type_dict)
-    return model(**parsed_dict)
+    return _fill_with_empty(parsed_dict, type_dict)
 
 
-def parse_xml(xml_content: str, model: Type[ModelType]) -> ModelType:
+def _get_at_path(parsed: Any, path: tuple) -> Any:
     """
-    Parse the XML content into a Pydantic model.
+    Follow a path of keys and indices into a parsed dictionary.
+    :param parsed: The parsed dictionary
+    :param path: The keys and indices to follow
+    :return: The value at the end of the path
+    """
+    for key in path:
+        parsed = parsed[key]
+    return parsed
+
+
+def _find_open_text(parsed: Any, path: tuple = ()) -> tuple | None:
+    """
+    Find the text value that ends with the open text sentinel in a parsed dictionary.
+    :param parsed: The parsed dictionary, list or value to search
+    :param path: The keys and indices leading to parsed
+    :return: The keys and indices leading to the text, or None if it is not found
+    """
+    if isinstance(parsed, str):
+        return path if parsed.endswith(_OPEN_TEXT_SENTINEL) else None
+
+    items = ()
+    if isinstance(parsed, dict):
+        items = parsed.items()
+    elif isinstance(parsed, list):
+        items = enumerate(parsed)
+    for key, value in items:
+        found: tuple | None = _find_open_text(value, path + (key,))
+        if found is not None:
+            return found
+    return None
+
+
+def _parse_with_fallback(
+    xml_content: str, model: Type[ModelType], type_dict: dict
+) -> ModelType:
+    """
+    Parse the XML content, retrying on cleaned XML if the initial parse fails.
     :param xml_content: The XML content to parse
     :param model: The Pydantic model to parse
+    :param type_dict: The type dictionary from inspect_type_annotation
     :return: The parsed Pydantic model
     """
-    assert isinstance(model, type) and issubclass(
-        model, BaseModel
-    ), "Model must be a Pydantic model"
-    type_dict: dict = _inspect_type_annotation(model)
     try:
         return _parse_xml(xml_content, model, type_dict)
     except Exception:
         return _parse_xml(xml_content, model, type_dict, failed_initial=True)
+
+
+def parse_xml(
+    xml_content: str | bytes | bytearray | memoryview, model: Type[ModelType]
+) -> ModelType:
+    """
+    Parse the XML content into a Pydantic model.
+    :param xml_content: The XML content to parse; bytes-like content is decoded as UTF-8
+    :param model: The Pydantic model to parse
+    :return: The parsed Pydantic model
+    """
+    assert isinstance(model, type) and issubclass(
+        model, BaseModel
+    ), "Model must be a Pydantic model"
+    if isinstance(xml_content, (bytes, bytearray, memoryview)):
+        xml_content = str(xml_content, "utf-8")
+    type_dict: dict = _model_type_dict(model)
+    return _parse_with_fallback(xml_content, model, type_dict)
+
+
+class IncrementalParser:
+    """
+    Parses streamed XML into a Pydantic model as chunks arrive.
+    The model is inspected once, chunks are buffered and only joined when a result is
+    requested, and a result is reused until more content is fed. Chunks that only
+    extend the text of the innermost open tag update that value and revalidate
+    instead of parsing all the content again.
+    """
+
+    def __init__(self, model: Type[ModelType]) -> None:
+        """
+        :param model: The Pydantic model to parse into
+        """
+        assert isinstance(model, type) and issubclass(
+            model, BaseModel
+        ), "Model must be a Pydantic model"
+        self.model: Type[ModelType] = model
+        self._type_dict: dict = _model_type_dict(model)
+        self._chunks: list[str] = []
+        self._decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(
+            "utf-8"
+        )()
+        self._result: ModelType | None = None
+        self._closed: bool = False
+        # Length of the content at the last full parse if text appended to it can be
+        # applied without reparsing, and where that text goes once it is worked out
+        self._parsed_length: int | None = None
+        self._open_text: tuple[ModelType | None, dict, tuple | None, str] | None = None
+
+    def feed(self, chunk: str | bytes | bytearray | memoryview) -> None:
+        """
+        Append a chunk of the streamed XML.
+        Bytes-like chunks, such as memoryview slices of a receive buffer, are decoded
+        as UTF-8 without an intermediate copy; a character split across chunks is held
+        back until the rest of it arrives.
+        :param chunk: The next piece of XML content
+        """
+        if self._closed:
+            raise ValueError("Cannot feed a closed IncrementalParser")
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            chunk = self._decoder.decode(chunk)
+        if chunk:
+            self._chunks.append(chunk)
+            self._result = None
+
+    def current_model(self) -> ModelType:
+        """
+        Parse the content fed so far.
+        :return: The parsed (possibly partial) Pydantic model
+        """
+        if self._result is None:
+            if len(self._chunks) > 1:
+                self._chunks = ["".join(self._chunks)]
+            content: str = self._chunks[0] if self._chunks else ""
+            result: ModelType | None = self._parse_appended_text(content)
+            self._result = result if result is not None else self._parse(content)
+        return self._result
+
+    def _parse(self, content: str) -> ModelType:
+        """
+        Parse all of the content.
+        :param content: The content fed so far
+        :return: The parsed Pydantic model
+        """
+        self._parsed_length = None
+        self._open_text = None
+        try:
+            result: ModelType = _parse_xml(content, self.model, self._type_dict)
+        except Exception:
+            return _parse_xml(content, self.model, self._type_dict, failed_initial=True)
+
+        # Text appended after an unfinished tag could complete it
+        if content.rfind("<") <= content.rfind(">") and (
+            _OPEN_TEXT_SENTINEL not in content
+        ):
+            self._parsed_length = len(content)
+        return result
+
+    def _parse_appended_text(self, content: str) -> ModelType | None:
+        """
+        Parse content that only adds text since the last full parse, without reparsing.
+        :param content: The content fed so far
+        :return: The parsed Pydantic model, or None if a full parse is needed
+        """
+        if self._parsed_length is None:
+            return None
+        appended: str = content[self._parsed_length :]
+        if not appended or "<" in appended:
+            return None
+
+        if self._open_text is None:
+            # Any text appended without a tag parses the same way as the sentinel does
+            try:
+                parsed_dict: dict = _parse_dict(
+                    content[: self._parsed_length] + _OPEN_TEXT_SENTINEL,
+                    self._type_dict,
+                )
+                path: tuple | None = _find_open_text(parsed_dict)
+                if path is None:
+                    self._open_text = (self.model(**parsed_dict), parsed_dict, None, "")
+                else:
+                    text: str = _get_at_path(parsed_dict, path)
+                    text = text[: -len(_OPEN_TEXT_SENTINEL)]
+                    self._open_text = (None, parsed_dict, path, text)
+            except Exception:
+                self._parsed_length = None
+                return None
+
+        result, parsed_dict, path, text = self._open_text
+        if path is None:
+            # The appended text is outside of any value, so its content does not matter
+            return result
+
+        _get_at_path(parsed_dict, path[:-1])[path[-1]] = text + appended
+        try:
+            return self.model(**parsed_dict)
+        except Exception:
+            return None
+
+    def close(self) -> ModelType:
+        """
+        Finish the stream; no more chunks can be fed afterwards.
+        :return: The parsed Pydantic model for the complete content
+        """
+        self._closed = True
+        tail: str = self._decoder.decode(b"", final=True)
+        if tail:
+            self._chunks.append(tail)
+            self._result = None
+        return self.current_model()
@@ -1,162 +1,761 @@
+import sys
 import types
 from enum import Enum
-from typing import Literal, Union, get_args
+from functools import lru_cache, wraps
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterator,
+    Literal,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+from weakref import WeakKeyDictionary
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from pydantic.fields import FieldInfo
 
-def _get_type_info(field_info: FieldInfo) -> str:
+from llmxml.parser import _camel_to_snake
+
+# Per model class caches; a model's fields are fixed once the class is built.
+# Keys are weak, but that alone does not free a class: cached fields hold their
+# annotations, so a model whose fields refer to itself keeps its own entry, and models
+# used as field types are also held by the bounded annotation caches until evicted.
+_FIELDS_CACHE: WeakKeyDictionary[Type[BaseModel], tuple[tuple[str, FieldInfo], ...]] = (
+    WeakKeyDictionary()
+)
+_TEMPLATE_CACHE: WeakKeyDictionary[Type[BaseModel], str] = WeakKeyDictionary()
+_PROMPT_CACHE: WeakKeyDictionary[Type[BaseModel], str] = WeakKeyDictionary()
+_ANNOTATIONS_CACHE: WeakKeyDictionary[Type[BaseModel], tuple[tuple[str, type], ...]] = (
+    WeakKeyDictionary()
+)
+_MODEL_TAGS_CACHE: WeakKeyDictionary[Type[BaseModel], tuple[str, str]] = WeakKeyDictionary()
+# Example skeletons of models whose fields are all single-line values; False otherwise
+_SKELETON_CACHE: WeakKeyDictionary[
+    Type[BaseModel], tuple[str, tuple[tuple[str, Callable[[Any], str]], ...]] | bool
+] = WeakKeyDictionary()
+
+# Annotations whose example value is rendered with str() directly
+_SCALAR_TYPES: frozenset[type] = frozenset({str, int, float, bool})
+
+# get_origin() of typing.Union[...] and of PEP 604 X | Y unions respectively
+_UNION_ORIGINS: frozenset = frozenset({Union, types.UnionType})
+_NONE_TYPE: type = type(None)
+
+# Requirement labels shared by every rendered field
+_REQUIRED: str = sys.intern("required")
+_OPTIONAL: str = sys.intern("optional")
+
+
+# Entries per annotation cache. Entries hold their annotation strongly, including any
+# model or Enum class in it, so a class stays alive until its entries are evicted.
+_ANNOTATION_CACHE_SIZE: int = 1024
+
+
+def _ordered_key(annotation: Any) -> tuple:
+    """
+    Build a key that tells annotations apart by the order of their arguments.
+    typing compares Union[A, B] equal to Union[B, A] and Literal["a", "b"] equal to
+    Literal["b", "a"], so the annotation alone would share one entry between them.
+    :param annotation: The type annotation, or a Literal value, to build a key for.
+    :return: A tuple of the annotation, its type and the keys of its arguments.
+    """
+    args = tuple(map(_ordered_key, get_args(annotation)))
+    return annotation, type(annotation), args
+
+
+def _annotation_key(annotation: Any) -> Hashable | None:
+    """
+    Get the cache key of an annotation.
+    :param annotation: The type annotation to build a key for.
+    :return: The key, or None if the annotation cannot be hashed, e.g. when its
+        Annotated metadata holds a dict.
+    """
+    key = _ordered_key(annotation)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _cached_per_annotation(func: Callable) -> Callable:
+    """
+    Cache a function of an annotation (its first argument) in a bounded LRU keyed
+    on _annotation_key. Annotations that cannot be hashed skip the cache.
+    :param func: The function to cache.
+    :return: The cached function.
+    """
+
+    @lru_cache(maxsize=_ANNOTATION_CACHE_SIZE)
+    def cached(key: Hashable, *args: Any) -> Any:
+        return func(*args)
+
+    @wraps(func)
+    def wrapper(annotation: Any, *args: Any) -> Any:
+        key = _annotation_key(annotation)
+        if key is None:
+            return func(annotation, *args)
+        return cached(key, annotation, *args)
+
+    return wrapper
+
+
+@lru_cache(maxsize=2048)
+def _default_description(field_name: str) -> str:
+    """
+    Get the description used for a field that does not define one.
+    :param field_name: The name of the field.
+    :return: The default description.
+    """
+    return f"Description of {field_name}"
+
+
+@lru_cache(maxsize=None)
+def _tags(name: str) -> tuple[str, str]:
+    """
+    Get the opening and closing XML tags for a name, built and interned once per name.
+    :param name: The tag name.
+    :return: A tuple of (opening tag, closing tag).
+    """
+    return sys.intern(f"<{name}>"), sys.intern(f"</{name}>")
+
+
+@_cached_per_annotation
+def _origin_args(annotation: type) -> tuple[type | None, tuple]:
+    """
+    Get the origin and arguments of a type annotation, computed once per annotation.
+    :param annotation: The type annotation to inspect.
+    :return: A tuple of (origin, args) as returned by get_origin and get_args.
+    """
+    return get_origin(annotation), get_args(annotation)
+
+
+@_cached_per_annotation
+def _is_union(annotation: type) -> bool:
+    """
+    Check if an annotation is a typing.Union or a Python 3.10+ X | Y union.
+    :param annotation: The type annotation to check.
+    :return: True if the annotation is a union, False otherwise.
+    """
+    return get_origin(annotation) in _UNION_ORIGINS
+
+
+def _model_fields(model: Type[BaseModel]) -> tuple[tuple[str, FieldInfo], ...]:
+    """
+    Get the (name, field info) pairs of a model, computed once per model class.
+    :param model: The Pydantic model class.
+    :return: A tuple of (field name, field info) pairs.
+    """
+    fields = _FIELDS_CACHE.get(model)
+    if fields is None:
+        fields = tuple(model.model_fields.items())
+        _FIELDS_CACHE[model] = fields
+    return fields
+
+
+def _model_annotations(model: Type[BaseModel]) -> tuple[tuple[str, type], ...]:
+    """
+    Get the (name, annotation) pairs of a model, computed once per model class.
+    :param model: The Pydantic model class.
+    :return: A tuple of (field name, annotation) pairs.
+    """
+    annotations = _ANNOTATIONS_CACHE.get(model)
+    if annotations is None:
+        annotations = tuple((name, info.annotation) for name, info in _model_fields(model))
+        _ANNOTATIONS_CACHE[model] = annotations
+    return annotations
+
+
+def _model_tags(model: Type[BaseModel]) -> tuple[str, str]:
+    """
+    Get the opening and closing snake_case tags of a model, computed once per model class.
+    :param model: The Pydantic model class.
+    :return: A tuple of (opening tag, closing tag).
+    """
+    tags = _MODEL_TAGS_CACHE.get(model)
+    if tags is None:
+        tags = _tags(_camel_to_snake(model.__name__))
+        _MODEL_TAGS_CACHE[model] = tags
+    return tags
+
+
+@_cached_per_annotation
+def _is_basemodel(annotation: type) -> bool:
     """
-    Extract and format the type information from a field.
-    :param field_info: The field info to extract type information from.
+    Check if an annotation is a Pydantic model class, computed once per annotation.
+    :param annotation: The type annotation to check.
+    :return: True if the annotation is a BaseModel subclass, False otherwise.
+    """
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+@_cached_per_annotation
+def _is_enum(annotation: type) -> bool:
+    """
+    Check if an annotation is an Enum class, computed once per annotation.
+    :param annotation: The type annotation to check.
+    :return: True if the annotation is an Enum subclass, False otherwise.
+    """
+    return isinstance(annotation, type) and issubclass(annotation, Enum)
+
+
+@lru_cache(maxsize=1024)
+def _enum_values(enum_type: Type[Enum]) -> str:
+    """
+    Format the allowed values of an Enum for the prompt, computed once per Enum class.
+    Entries keep their Enum class alive, so the cache is bounded.
+    :param enum_type: The Enum class to format.
+    :return: The comma-separated member values.
+    """
+    return ", ".join(str(e.value) for e in enum_type)
+
+
+class _FieldKind(Enum):
+    """The shape of an annotation, deciding how its field is rendered."""
+
+    SCALAR = "scalar"
+    UNION = "union"
+    LIST = "list"
+    MODEL = "model"
+    ENUM = "enum"
+    OTHER = "other"
+
+
+class _FieldPlan:
+    """
+    The classification of an annotation. List plans carry the plan of their item type;
+    union plans keep only their non-None members in args, so Optional[T] is one check.
+    """
+
+    __slots__ = ("kind", "annotation", "args", "item")
+
+    def __init__(
+        self,
+        kind: _FieldKind,
+        annotation: type,
+        args: tuple = (),
+        item: "_FieldPlan | None" = None,
+    ) -> None:
+        self.kind = kind
+        self.annotation = annotation
+        self.args = args
+        self.item = item
+
+
+# Kinds whose example values render as str(value)
+_TEXT_KINDS: frozenset[_FieldKind] = frozenset({_FieldKind.SCALAR, _FieldKind.OTHER})
+
+# Kinds whose fields render as a single leaf element in the prompt template
+_LEAF_KINDS: frozenset[_FieldKind] = frozenset(
+    {_FieldKind.SCALAR, _FieldKind.UNION, _FieldKind.OTHER}
+)
+
+
+@_cached_per_annotation
+def _plan(annotation: type) -> _FieldPlan:
+    """
+    Classify an annotation, computed once per annotation.
+    :param annotation: The type annotation to classify.
+    :return: The plan used to render fields of this type.
+    """
+    # Only classes are looked up: the set lookup hashes, Annotated metadata may not.
+    if isinstance(annotation, type) and annotation in _SCALAR_TYPES:
+        return _FieldPlan(_FieldKind.SCALAR, annotation)
+
+    origin, args = _origin_args(annotation)
+    if _is_union(annotation):
+        members = tuple(arg for arg in args if arg is not _NONE_TYPE)
+        return _FieldPlan(_FieldKind.UNION, annotation, members)
+    if origin is list:
+        return _FieldPlan(_FieldKind.LIST, annotation, args, _plan(args[0]))
+    if _is_basemodel(annotation):
+        return _FieldPlan(_FieldKind.MODEL, annotation)
+    if _is_enum(annotation):
+        return _FieldPlan(_FieldKind.ENUM, annotation)
+    return _FieldPlan(_FieldKind.OTHER, annotation)
+
+
+@_cached_per_annotation
+def _type_info_for(annotation: type) -> str:
+    """
+    Format the type information for an annotation, cached per annotation and
+    argument order.
+    :param annotation: The type annotation to describe.
     :return: A string representation of the type information.
     """
-    if (
-        hasattr(field_info.annotation, "__name__")
-        and field_info.annotation.__name__ == "XMLSafeString"
-    ):
+    # XMLSafeString is not importable here, so it is matched by name.
+    if getattr(annotation, "__name__", None) == "XMLSafeString":
         return "type: str"
 
-    if (
-        hasattr(field_info.annotation, "__origin__")
-        and field_info.annotation.__origin__ is Union
-    ) or (isinstance(field_info.annotation, types.UnionType)):
-        subtypes = get_args(field_info.annotation)
+    origin, args = _origin_args(annotation)
+
+    if _is_union(annotation):
         type_names = [
             t.__name__ if hasattr(t, "__name__") else str(t).replace("NoneType", "None")
-            for t in subtypes
+            for t in args
         ]
-        return f"type: {' | '.join(type_names)}"
+        return sys.intern(f"type: {' | '.join(type_names)}")
+
+    if origin is Literal:
+        return sys.intern(f"type: Literal[{', '.join(map(str, args))}]")
+
+    if origin is list:
+        if _is_union(args[0]):
+            type_names = [t.__name__ for t in _origin_args(args[0])[1]]
+            return sys.intern(f"type: list of {', '.join(map(repr, type_names))}")
+
+    return sys.intern(f"type: {annotation.__name__}")
+
+
+@_cached_per_annotation
+def _render_union_options(union_type: type) -> str:
+    """
+    Render the model options of a union, cached per union type and member order.
+    :param union_type: The Union whose BaseModel members are rendered.
+    :return: The options joined by OR separators.
+    """
+    subtype_fields: list[str] = []
+    for idx, subtype in enumerate(get_args(union_type), 1):
+        if _plan(subtype).kind is _FieldKind.MODEL:
+            model_name = _camel_to_snake(subtype.__name__)
+            body = _render_model_fields(subtype)
+            subtype_fields.append(
+                f"\n# Option {idx}: {subtype.__name__}\n<{model_name}>\n{body}\n</{model_name}>\n"
+            )
+    return "\nOR\n".join(subtype_fields)
+
+
+def _render_model_fields(model: Type[BaseModel]) -> str:
+    """
+    Render the templates of all fields of a model, computed once per model class.
+    :param model: The Pydantic model to render.
+    :return: The newline-joined field templates.
+    """
+    template = _TEMPLATE_CACHE.get(model)
+    if template is None:
+        template = "\n".join(
+            [_process_field(name, info) for name, info in _model_fields(model)]
+        )
+        _TEMPLATE_CACHE[model] = template
+    return template
+
+
+class PromptedModel(BaseModel):
+    """
+    Base model whose prompt template is rendered once, when the subclass is defined.
+    Subclasses pay the schema introspection cost at import time instead of on the
+    first call to generate_prompt_template.
+    """
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Models with unresolved forward references are rendered lazily on first use
+        if cls.__pydantic_complete__:
+            _render_model_fields(cls)
 
-    if hasattr(field_info.annotation, "__origin__"):
-        origin = field_info.annotation.__origin__
-        if origin is Literal:
-            allowed_values = get_args(field_info.annotation)
-            return f"type: Literal[{', '.join(map(str, allowed_values))}]"
-        elif origin is list:
-            args = get_args(field_info.annotation)[0]
-            if hasattr(args, "__origin__") and args.__origin__ is Union:
-                subtypes = get_args(args)
-                type_names = [t.__name__ for t in subtypes]
-                return f"type: list of {', '.join(map(repr, type_names))}"
 
-    return f"type: {field_info.annotation.__name__}"
+def _process_field(field_name: str, field_info) -> str:
+    """Process a single field and return its XML representation."""
+    return _render_field(
+        field_info.annotation,
+        field_name,
+        field_info.description,
+        field_info.is_required(),
+    )
 
 
-def _process_nested_union_list(
-    field_name: str, field_info: FieldInfo, type_info: str
+@_cached_per_annotation
+def _render_field(
+    annotation: type, field_name: str, description: str | None, required: bool
 ) -> str:
     """
-    Process fields that are list[Union[...]] or list[X|Y|Z] types with nested fields.
-    :param field_name: The name of the field to process.
-    :param field_info: The field info to process.
-    :param type_info: The type information to use.
+    Render a single field, computed once per distinct field definition.
+    Fields that repeat across models (same name, type, description and requirement)
+    share one rendering.
+    :param annotation: The type annotation of the field.
+    :param field_name: The name of the field.
+    :param description: The description of the field, if any.
+    :param required: Whether the field is required.
     :return: An XML string representation of the field.
     """
-    args = get_args(field_info.annotation)[0]
-    # Check for both typing.Union and Python 3.10+ builtin union (types.UnionType)
-    if (hasattr(args, "__origin__") and args.__origin__ is Union) or (
-        isinstance(args, types.UnionType)
-    ):
-        subtypes = get_args(args)
-        subtype_fields = []
-        for idx, subtype in enumerate(subtypes, 1):
-            if isinstance(subtype, type) and issubclass(subtype, BaseModel):
-                subfields = subtype.model_fields
-                # Convert CamelCase to snake_case for the model name
-                model_name = "".join(
-                    [f"_{c.lower()}" if c.isupper() else c for c in subtype.__name__]
-                ).lstrip("_")
-                subtype_fields.append(
-                    f"\n# Option {idx}: {subtype.__name__}"
-                    + f"\n<{model_name}>"
-                    + "\n"
-                    + "\n".join(
-                        _process_field(name, info) for name, info in subfields.items()
-                    )
-                    + f"\n</{model_name}>"
-                    + "\n"
-                )
-        if field_info.description:
-            return (
-                f"<{field_name}>\n[{type_info}]\n[{field_info.description}]"
-                + "\nOR\n".join(subtype_fields)
-                + f"\n</{field_name}>"
+    type_info = _type_info_for(annotation)
+    required_info = _REQUIRED if required else _OPTIONAL
+    description = description or _default_description(field_name)
+
+    plan = _plan(annotation)
+
+    # Most fields are scalars, Literals or unions and render as a plain leaf
+    if plan.kind in _LEAF_KINDS:
+        return f"<{field_name}>\n[{type_info}]\n[{required_info}]\n[{description}]\n</{field_name}>"
+
+    if plan.kind is _FieldKind.ENUM:
+        enum_name = annotation.__name__
+        enum_values = _enum_values(annotation)
+        return f"<{field_name}>\n[type: {enum_name}]\n[{required_info}]\n[{description}]\n[{enum_name} values: {enum_values}]\n</{field_name}>"
+
+    if plan.kind is _FieldKind.LIST:
+        item = plan.item
+        item_type: type = item.annotation
+
+        if item.kind is _FieldKind.MODEL:
+            item_name: str = _camel_to_snake(item_type.__name__)
+            body = _render_model_fields(item_type)
+            return f"<{field_name}>\n[type: list[{item_type.__name__}]]\n[{required_info}]\n[{description}]\n<{item_name}>\n{body}\n</{item_name}>\n</{field_name}>"
+
+        # If the list contains enums, show possible values
+        if item.kind is _FieldKind.ENUM:
+            enum_values = _enum_values(item_type)
+            return f"<{field_name}>\n[type: list[{item_type.__name__}]]\n[{required_info}]\n[{description}]\n[{item_type.__name__} values: {enum_values}]\n</{field_name}>"
+
+        # list[Union[...]] and list[X | Y] show each model option
+        if item.kind is _FieldKind.UNION:
+            options = _render_union_options(item_type)
+            return f"<{field_name}>\n[{type_info}]\n[{description}]{options}\n</{field_name}>"
+
+    if plan.kind is _FieldKind.MODEL:
+        body = _render_model_fields(annotation)
+        return f"<{field_name}>\n[{type_info}]\n[{required_info}]\n[{description}]\n{body}\n</{field_name}>"
+
+    return f"<{field_name}>\n[{type_info}]\n[{required_info}]\n[{description}]\n</{field_name}>"
+
+
+_BASE_INSTRUCTIONS = """
+You are to provide your output in the following xml-like format EXACTLY as described in the schema provided.
+Each field in the schema has a description, type, and requirement status enclosed in square brackets, denoting that they are metadata.
+Format instructions:
+<field_name>
+[type: object_type]
+[required/optional]
+[description if available]
+[enum values if applicable]
+</field_name>
+
+If the field is a list, you create a new <field_name> for each item in the list.
+""".strip()
+
+def generate_base_instructions() -> str:
+    return _BASE_INSTRUCTIONS
+
+class Priority(Enum):
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
+
+class ResourceType(Enum):
+    CONFIG = "configuration"
+    DATA = "data"
+    TEMPLATE = "template"
+
+class DirectAction(BaseModel):
+    action_type: Literal["direct"] = Field(..., description="Immediate action to be performed")
+    instruction: str = Field(..., description="The specific instruction to execute")
+    priority: Priority = Field(..., description="Priority level of the action")
+
+class GenerateAction(BaseModel):
+    action_type: Literal["generate"] = Field(..., description="Creation of new content/resource")
+    resource_identifier: str = Field(..., description="Unique identifier for the new resource")
+    resource_type: ResourceType = Field(..., description="Type of resource being generated")
+    resource_content: str = Field(..., description="The content/data to be generated")
+    metadata: str | None = Field(None, description="Additional information about the resource")
+
+class ModifyAction(BaseModel):
+    action_type: Literal["modify"] = Field(..., description="Modification of existing content/resource")
+    target_identifier: str = Field(..., description="Identifier of the resource to modify")
+    updated_content: str = Field(..., description="The modified content/data")
+    backup_needed: bool | None = Field(None, description="Whether to create backup before modification")
+
+class ExampleSchema(BaseModel):
+    reasoning: str | None = Field(None, description="Detailed thought process explaining the approach")
+    actions: list[Union[DirectAction, GenerateAction, ModifyAction]] = Field(..., description="The actions to perform")
+
+def generate_example_output() -> str:
+    example = ExampleSchema(
+        reasoning="To accomplish the task, we'll first generate a new configuration resource with required parameters, then modify an existing resource while ensuring we create a backup.",
+        actions=[
+            GenerateAction(
+                action_type="generate",
+                resource_identifier="resources/config.json",
+                resource_type=ResourceType.CONFIG,
+                resource_content='''{
+  "type": "configuration",
+  "parameters": {
+    "primary": "value1",
+    "secondary": "value2",
+    "timeout": 30
+  }
+}''',
+                metadata="Version: 1.0, Environment: Production"
+            ),
+            DirectAction(
+                action_type="direct",
+                instruction="Update system cache",
+                priority=Priority.HIGH
             )
+        ]
+    )
+    return generate_example(example)
+
+@lru_cache(maxsize=None)
+def _adhere_instructions_prefix() -> str:
+    """
+    Builds the schema-independent part of the instructions prompt once.
+    :return: The base instructions and worked example, up to the schema heading.
+    """
+    return "\n\n".join([
+        generate_base_instructions(),
+        "Basic example:",
+        "<EXAMPLE>",
+        "<EXAMPLE_SCHEMA>",
+        _generate_template_string(ExampleSchema),
+        "</EXAMPLE_SCHEMA>",
+        "",
+        "<EXAMPLE_OUTPUT>",
+        generate_example_output(),
+        "</EXAMPLE_OUTPUT>",
+        "</EXAMPLE>",
+        "",
+        "Requested Response Schema:",
+    ])
+
+_ADHERE_INSTRUCTIONS_SUFFIX = "Make sure to return an instance of the output, NOT the schema itself. Do NOT include any schema metadata (like [type: ...]) in your output."
+
+def ADHERE_INSTRUCTIONS_PROMPT(schema: str) -> str:
+    return f"{_adhere_instructions_prefix()}\n\n{schema}\n\n\n\n{_ADHERE_INSTRUCTIONS_SUFFIX}"
+
+def _generate_template_string(model: Type[BaseModel]) -> str:
+    """
+    Generates a template string from a Pydantic model's fields.
+    :param model: The Pydantic model to process
+    :return: Combined template string of processed fields
+    """
+    return _render_model_fields(model)
+
+def generate_prompt_template(model: Type[BaseModel], include_instructions: bool = True) -> str:
+    """
+    Generates a prompt template from a Pydantic model.
+    :param model: The Pydantic model to generate a prompt template for.
+    :param include_instructions: Whether to include instructions in the template.
+    :return: A string representation of the prompt template.
+    """
+    if not include_instructions:
+        return _generate_template_string(model)
+
+    prompt = _PROMPT_CACHE.get(model)
+    if prompt is None:
+        template = _generate_template_string(model)
+        prompt = f"<response_instructions>\n{ADHERE_INSTRUCTIONS_PROMPT(template)}\n</response_instructions>"
+        _PROMPT_CACHE[model] = prompt
+    return prompt
+
+def iter_prompt_template(
+    model: Type[BaseModel], include_instructions: bool = True
+) -> Iterator[str]:
+    """
+    Yields the prompt template of a Pydantic model in fragments, one field at a time.
+    Joining the fragments gives the same string as generate_prompt_template.
+    :param model: The Pydantic model to generate a prompt template for.
+    :param include_instructions: Whether to include instructions in the template.
+    :return: An iterator over the fragments of the prompt template.
+    """
+    if include_instructions:
+        yield f"<response_instructions>\n{_adhere_instructions_prefix()}\n\n"
+
+    for idx, (field_name, field_info) in enumerate(_model_fields(model)):
+        if idx:
+            yield "\n"
+        yield _process_field(field_name, field_info)
+
+    if include_instructions:
+        yield f"\n\n\n\n{_ADHERE_INSTRUCTIONS_SUFFIX}\n</response_instructions>"
+
+def _to_str(value: any) -> str:
+    """
+    Converts any primitive value to string.
+    :param value: The value to convert to string.
+    :return: A string representation of the value.
+    """
+    if type(value) is str:
+        return value
+    return "" if value is None else str(value)
+
+
+def _enum_to_str(value: Enum | None) -> str:
+    """
+    Converts an Enum member to the string of its value.
+    :param value: The Enum member to convert.
+    :return: The member's value as a string, or an empty string if unset.
+    """
+    return "" if value is None else _to_str(value.value)
+
+
+def _flat_skeleton(
+    model: Type[BaseModel],
+) -> tuple[str, tuple[tuple[str, Callable[[Any], str]], ...]] | bool:
+    """
+    Build the example skeleton of a model whose fields all render on a single line,
+    computed once per model class.
+    :param model: The Pydantic model class.
+    :return: A (format string, ((field name, to-string function), ...)) pair, or False if any
+        field is a nested model, a list or a union involving either.
+    """
+    skeleton = _SKELETON_CACHE.get(model)
+    if skeleton is not None:
+        return skeleton
+
+    lines = [_model_tags(model)[0]]
+    fields: list[tuple[str, Callable[[Any], str]]] = []
+    skeleton = False
+    for field_name, annotation in _model_annotations(model):
+        plan = _plan(annotation)
+        if plan.kind is _FieldKind.UNION:
+            # Every member of the union must itself render as plain text
+            flat = all(_plan(arg).kind in _TEXT_KINDS for arg in plan.args)
         else:
-            return (
-                f"<{field_name}>\n[{type_info}]"
-                + "\nOR\n".join(subtype_fields)
-                + f"\n</{field_name}>"
-            )
-    return ""
+            flat = plan.kind in _TEXT_KINDS or plan.kind is _FieldKind.ENUM
+        if not flat:
+            break
+        open_tag, close_tag = _tags(field_name)
+        lines.append(f"{open_tag}{{}}{close_tag}")
+        fields.append(
+            (field_name, _enum_to_str if plan.kind is _FieldKind.ENUM else _to_str)
+        )
+    else:
+        lines.append(_model_tags(model)[1])
+        skeleton = ("\n".join(lines), tuple(fields))
 
-def _process_field(field_name: str, field_info) -> str:
-    """Process a single field and return its XML representation."""
-    type_info = _get_type_info(field_info)
-    required_info = "required" if field_info.is_required() else "optional"
-
-    # Handle Enum types
-    if isinstance(field_info.annotation, type) and issubclass(field_info.annotation, Enum):
-        enum_values = [e.value for e in field_info.annotation]
-        output = f"<{field_name}>\n[type: {field_info.annotation.__name__}]\n[{required_info}]"
-        if field_info.description:
-            output += f"\n[{field_info.description}]"
-        output += f"\n[{field_info.annotation.__name__} values: {', '.join(map(str, enum_values))}]\n</{field_name}>"
-        return output
-
-    if (
-        hasattr(field_info.annotation, "__origin__")
-        and field_info.annotation.__origin__ is list
-    ):
-        item_type: type = get_args(field_info.annotation)[0]
-
-        if isinstance(item_type, type) and issubclass(item_type, BaseModel):
-            nested_fields: dict[str, FieldInfo] = item_type.model_fields
-            item_name: str = item_type.__name__.lower()
-            nested_prompts: list[str] = [
-                _process_field(name, info) for name, info in nested_fields.items()
-            ]
-            output = f"<{field_name}>\n[type: list[{item_type.__name__}]]\n[{required_info}]"
-            if field_info.description:
-                output += f"\n[{field_info.description}]"
-            output += (
-                f"\n<{item_name}>\n"
-                + "\n".join(nested_prompts)
-                + f"\n</{item_name}>\n</{field_name}>"
+    _SKELETON_CACHE[model] = skeleton
+    return skeleton
+
+
+def _emit_field(out: list[str], field_name: str, value: any, annotation: type) -> None:
+    """
+    Append the lines of <field_name>...</field_name>, interpreting type annotation if needed.
+    :param out: The list of output lines to append to.
+    :param field_name: The name of the field to produce XML for.
+    :param value: The value of the field to produce XML for.
+    :param annotation: The type annotation of the field to produce XML for.
+    """
+    open_tag, close_tag = _tags(field_name)
+    plan = _plan(annotation)
+    kind = plan.kind
+
+    if kind is _FieldKind.SCALAR:
+        out.append(f"{open_tag}{_to_str(value)}{close_tag}")
+        return
+
+    # Unset values need no further dispatch, except models which render empty tags
+    if value is None:
+        if kind is _FieldKind.LIST:
+            out.append("")
+            return
+        if kind is not _FieldKind.MODEL:
+            out.append(open_tag + close_tag)
+            return
+
+    if kind is _FieldKind.UNION:
+        # Members are told apart by kind, as in _flat_skeleton: plain members such as
+        # Literal render as text, since typing generics cannot be used with isinstance.
+        for arg in plan.args:
+            arg_kind = _plan(arg).kind
+            if arg_kind in _TEXT_KINDS:
+                continue
+            if isinstance(value, list if arg_kind is _FieldKind.LIST else arg):
+                _emit_field(out, field_name, value, arg)
+                return
+        out.append(f"{open_tag}{_to_str(value)}{close_tag}")
+        return
+
+    if kind is _FieldKind.LIST:
+        if not value:
+            # An empty list still takes up a (blank) line
+            out.append("")
+            return
+        # Resolve the item emitter once for the whole list rather than per item
+        item = plan.item
+        if item.kind is _FieldKind.SCALAR:
+            out.extend(f"{open_tag}{_to_str(v)}{close_tag}" for v in value)
+            return
+        if item.kind is _FieldKind.ENUM:
+            out.extend(
+                f"{open_tag}{_enum_to_str(v)}{close_tag}" for v in value
             )
-            return output
+            return
+        if item.kind is _FieldKind.MODEL:
+            # Model items skip the per-item dispatch; unset items keep their empty tags
+            for v in value:
+                if v is None:
+                    _emit_field(out, field_name, v, item.annotation)
+                    continue
+                out.append(open_tag)
+                _emit_model(out, v)
+                out.append(close_tag)
+            return
+        for v in value:
+            _emit_field(out, field_name, v, item.annotation)
+        return
 
-        # If the list contains enums, show possible values
-        if isinstance(item_type, type) and issubclass(item_type, Enum):
-            enum_values = [e.value for e in item_type]
-            output = f"<{field_name}>\n[type: list[{item_type.__name__}]]\n[{required_info}]"
-            if field_info.description:
-                output += f"\n[{field_info.description}]"
-            output += f"\n[{item_type.__name__} values: {', '.join(map(str, enum_values))}]\n</{field_name}>"
-            return output
-
-        nested_result: str = _process_nested_union_list(
-            field_name, field_info, type_info
+    if kind is _FieldKind.MODEL:
+        if value is None:
+            # If the value is None, just output empty tags for the nested model
+            model_open, model_close = _model_tags(annotation)
+            out.append(f"{open_tag}\n{model_open}{model_close}\n{close_tag}")
+            return
+        out.append(open_tag)
+        _emit_model(out, value)
+        out.append(close_tag)
+        return
+
+    if kind is _FieldKind.ENUM:
+        out.append(f"{open_tag}{_enum_to_str(value)}{close_tag}")
+        return
+
+    out.append(f"{open_tag}{_to_str(value)}{close_tag}")
+
+
+def _emit_model(out: list[str], model_instance: BaseModel) -> None:
+    """
+    Recursively append the XML lines of a model instance.
+    The top-level tag for this sub-block is the snake-cased name of the instance's class.
+    :param out: The list of output lines to append to.
+    :param model_instance: The Pydantic model instance to generate an example for.
+    """
+    model = type(model_instance)
+    values = model_instance.__dict__
+
+    skeleton = _flat_skeleton(model)
+    if skeleton:
+        template, fields = skeleton
+        out.append(template.format(*[to_str(values.get(name)) for name, to_str in fields]))
+        return
+
+    model_open, model_close = _model_tags(model)
+    out.append(model_open)
+    for field_name, annotation in _model_annotations(model):
+        _emit_field(out, field_name, values.get(field_name), annotation)
+    out.append(model_close)
+
+
+def generate_example(instance: BaseModel) -> str:
+    """
+    Generates an XML representation of the given Pydantic model instance,
+    reusing its actual field values (rather than sample placeholders).
+    :param instance: The Pydantic model instance to generate an example for.
+    :return: An XML string representation of the instance.
+    """
+    # Pydantic model classes have a custom metaclass, so a single isinstance check
+    # against type catches them without walking the MRO.
+    if isinstance(instance, type):
+        raise TypeError(
+            "generate_example() expected a Pydantic model instance, not the class. "
+            "Create an instance first, then pass it in."
         )
-        if nested_result:
-            return nested_result
-
-    if isinstance(field_info.annotation, type) and issubclass(
-        field_info.annotation, BaseModel
-    ):
-        nested_fields = field_info.annotation.model_fields
-        nested_prompts = [
-            _process_field(name, info) for name, info in nested_fields.items()
-        ]
-        output = f"<{field_name}>\n[{type_info}]\n[{required_info}]"
-        if field_info.description:
-            output += f"\n[{field_info.description}]"
-        output += "\n" + "\n".join(nested_prompts) + f"\n</{field_name}>"
-        return output
-
-    output = f"<{field_name}>\n[{type_info}]\n[{required_info}]"
-    if field_info.description:
-        output += f"\n[{field_info.description}]"
-    output += f"\n</{field_name}>"
-    return output
+
+    out: list[str] = []
+    _emit_model(out, instance)
+    return "\n".join(out)
+
@@ -1,19 +1,25 @@
 import json
 from enum import Enum, StrEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Type, TypeVar, Union
 
+import pytest
 from pydantic import BaseModel, Field
 from rich.console import Console
 
-from llmxml import parse_xml
+from llmxml import IncrementalParser, parse_xml
 
 T = TypeVar("T", bound=BaseModel)
 
+# Chunk sizes fed by the streaming tests; 1 keeps character-level coverage.
+STREAMING_CHUNK_SIZES = [1, 8, 64]
+
 
 console = Console()
 
 
+@lru_cache(maxsize=None)
 def load_test_file(filename: str) -> str:
     """Load test file content."""
     test_dir = Path(__file__).parent / "test_files"
@@ -27,6 +33,26 @@ def validate_parsed_model(parsed: BaseModel, model_class: Type[T]) -> None:
         isinstance(parsed, model_class)
         or type(parsed).__name__.startswith(f"Partial{model_class.__name__}")
     ), f"Expected {model_class.__name__} or Partial{model_class.__name__}, got {type(parsed).__name__}"
+    parsed.model_dump()
+
+
+def stream_model(xml: str, model_class: Type[T], chunk_size: int) -> T:
+    """Feed XML to an IncrementalParser in chunks and return the final model"""
+    parser = IncrementalParser(model_class)
+    for start in range(0, len(xml), chunk_size):
+        chunk = xml[start : start + chunk_size]
+        parser.feed(chunk)
+        # Partial results are checked each time a chunk completes a tag
+        if ">" in chunk:
+            validate_parsed_model(parser.current_model(), model_class)
+
+    result = parser.current_model()
+    validate_parsed_model(result, model_class)
+    return result
+
+
+def validate_json_serializable(parsed: BaseModel) -> None:
+    """Helper function to check that a parsed model round-trips through JSON"""
     json_str = parsed.model_dump_json()
     assert json.loads(json_str), "Model should be JSON serializable"
 
@@ -89,18 +115,14 @@ class TestFileAction:
 
     import time
 
-    def test_enum_nested_streaming(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("chunk_size", STREAMING_CHUNK_SIZES)
+    def test_enum_nested_streaming(self, chunk_size: int):
         xml = load_test_file("enum_nested.xml")
-        partial_content = ""
-        last_valid_result = None
-
-        for char in xml:
-            partial_content += char
-            result = parse_xml(partial_content, EnumSearchResponse)
-            validate_parsed_model(result, EnumSearchResponse)
-            last_valid_result = result
+        last_valid_result = stream_model(xml, EnumSearchResponse, chunk_size)
 
         assert last_valid_result is not None
+        validate_json_serializable(last_valid_result)
         assert isinstance(last_valid_result, EnumSearchResponse)
         assert len(last_valid_result.search_results) == 2
         assert (
@@ -125,21 +147,52 @@ class TestBasicResponse:
         assert result.thinking.strip() != ""
         assert len(result.movies) > 0
 
-    def test_basic_response_streaming(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("chunk_size", STREAMING_CHUNK_SIZES)
+    def test_basic_response_streaming(self, chunk_size: int):
         xml = load_test_file("basic_response.xml")
-        partial_content = ""
-        last_valid_result = None
-        for char in xml:
-            partial_content += char
-            result = parse_xml(partial_content, BasicResponse)
-            validate_parsed_model(result, BasicResponse)
-            last_valid_result = result
+        last_valid_result = stream_model(xml, BasicResponse, chunk_size)
 
         assert last_valid_result is not None
+        validate_json_serializable(last_valid_result)
         assert isinstance(last_valid_result, BasicResponse)
         assert last_valid_result.thinking.strip() != ""
         assert len(last_valid_result.movies) > 0
 
+    def test_basic_response_bytes(self):
+        xml = load_test_file("basic_response.xml")
+        assert parse_xml(xml.encode(), BasicResponse) == parse_xml(xml, BasicResponse)
+
+    def test_incremental_parser_close(self):
+        xml = load_test_file("basic_response.xml")
+        parser = IncrementalParser(BasicResponse)
+        midpoint = len(xml) // 2
+        parser.feed(xml[:midpoint])
+        parser.feed(xml[midpoint:])
+        result = parser.close()
+        assert result == parse_xml(xml, BasicResponse)
+        with pytest.raises(ValueError):
+            parser.feed("<thinking>")
+
+    def test_incremental_parser_bytes(self):
+        xml = "<thinking>Café ☕</thinking><movies>Amélie</movies>"
+        parser = IncrementalParser(BasicResponse)
+        for byte in xml.encode():
+            parser.feed(bytes([byte]))
+            validate_parsed_model(parser.current_model(), BasicResponse)
+        result = parser.close()
+        validate_json_serializable(result)
+        assert result.thinking == "Café ☕"
+        assert result == parse_xml(xml, BasicResponse)
+
+    def test_incremental_parser_memoryview(self):
+        xml = load_test_file("basic_response.xml")
+        buffer = memoryview(xml.encode())
+        parser = IncrementalParser(BasicResponse)
+        for start in range(0, len(buffer), 7):
+            parser.feed(buffer[start : start + 7])
+        assert parser.close() == parse_xml(xml, BasicResponse)
+
 
 class CreateAction(BaseModel):
     new_file_path: str = Field(..., description="The path to the new file to create")
@@ -189,18 +242,14 @@ class TestActions:
         assert edit_action.original_file_path.endswith(".tsx")
         assert "SearchBar" in edit_action.new_file_contents
 
-    def test_complete_response_streaming(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("chunk_size", STREAMING_CHUNK_SIZES)
+    def test_complete_response_streaming(self, chunk_size: int):
         xml = load_test_file("complete.xml")
-        partial_content = ""
-        last_valid_result = None
-        for char in xml:
-            partial_content += char
-            result = parse_xml(partial_content, CodeAction)
-
-            validate_parsed_model(result, CodeAction)
-            last_valid_result = result
+        last_valid_result = stream_model(xml, CodeAction, chunk_size)
 
         assert last_valid_result is not None
+        validate_json_serializable(last_valid_result)
         assert isinstance(last_valid_result, CodeAction)
         assert len(last_valid_result.actions) > 0
 
@@ -219,17 +268,14 @@ class TestActions:
         assert "PlaylistGrid" in action.file_contents
         assert "grid" in action.file_contents.lower()
 
-    def test_partial_response_streaming(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("chunk_size", STREAMING_CHUNK_SIZES)
+    def test_partial_response_streaming(self, chunk_size: int):
         xml = load_test_file("partial.xml")
-        partial_content = ""
-        last_valid_result = None
-        for char in xml:
-            partial_content += char
-            result = parse_xml(partial_content, CodeAction)
-            validate_parsed_model(result, CodeAction)
-            last_valid_result = result
+        last_valid_result = stream_model(xml, CodeAction, chunk_size)
 
         assert last_valid_result is not None
+        validate_json_serializable(last_valid_result)
         assert isinstance(last_valid_result, CodeAction)
         assert len(last_valid_result.actions) == 1
 
@@ -250,18 +296,14 @@ class TestActions:
         assert action.new_file_path == "components/PlayerControls.tsx"
         assert "PlayerControls" in action.file_contents
 
-    def test_streaming_response_streaming(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("chunk_size", STREAMING_CHUNK_SIZES)
+    def test_streaming_response_streaming(self, chunk_size: int):
         xml = load_test_file("streaming.xml")
-        partial_content = ""
-        last_valid_result = None
-
-        for char in xml:
-            partial_content += char
-            result = parse_xml(partial_content, CodeAction)
-            validate_parsed_model(result, CodeAction)
-            last_valid_result = result
+        last_valid_result = stream_model(xml, CodeAction, chunk_size)
 
         assert last_valid_result is not None
+        validate_json_serializable(last_valid_result)
         assert isinstance(last_valid_result, CodeAction)
         assert len(last_valid_result.actions) == 1
 
@@ -290,9 +332,8 @@ class ResponseObject(BaseModel):
     )
 
 
-class TestMovies:
-    def test_movies_response(self):
-        xml = """<response>
+# Shared by the parse and streaming movie tests
+MOVIES_XML = """<response>
 <movies>
 <movie>
 <title>Avatar</title>
@@ -316,47 +357,24 @@ class TestMovies:
 </movie>
 </movies>
 </response>
-        """
+"""
+
+
+class TestMovies:
+    def test_movies_response(self):
+        xml = MOVIES_XML
         result = parse_xml(xml, ResponseObject)
         assert len(result.response.movies) == 5
         assert result.response.movies[0].title == "Avatar"
 
-    def test_movies_response_streaming(self):
-        xml = """<response>
-<movies>
-<movie>
-<title>Avatar</title>
-<director>James Cameron</director>
-</movie>
-<movie>
-<title>Avengers: Endgame</title>
-<director>Anthony and Joe Russo</director>
-</movie>
-<movie>
-<title>Titanic</title>
-<director>James Cameron</director>
-</movie>
-<movie>
-<title>Star Wars: The Force Awakens</title>
-<director>J.J. Abrams</director>
-</movie>
-<movie>
-<title>Jurassic World</title>
-<director>Colin Trevorrow</director>
-</movie>
-</movies>
-</response>
-        """
-        partial_content = ""
-        last_valid_result = None
-        for char in xml:
-            partial_content += char
-            result = parse_xml(partial_content, ResponseObject)
-
-            validate_parsed_model(result, ResponseObject)
-            last_valid_result = result
+    @pytest.mark.slow
+    @pytest.mark.parametrize("chunk_size", STREAMING_CHUNK_SIZES)
+    def test_movies_response_streaming(self, chunk_size: int):
+        xml = MOVIES_XML
+        last_valid_result = stream_model(xml, ResponseObject, chunk_size)
 
         assert last_valid_result is not None
+        validate_json_serializable(last_valid_result)
         assert isinstance(last_valid_result, ResponseObject)
         assert len(last_valid_result.response.movies) == 5
 
@@ -387,27 +405,18 @@ class TestDetails:
         assert "," in result.birth_place
         assert result.occupation.count(",") <= 1
 
-    def test_details_streaming(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("chunk_size", STREAMING_CHUNK_SIZES)
+    def test_details_streaming(self, chunk_size: int):
         xml = load_test_file("details.xml")
-        partial_content = ""
-        last_valid_result = None
-        for char in xml:
-            partial_content += char
-            result = parse_xml(partial_content, Details)
-
-            validate_parsed_model(result, Details)
-            last_valid_result = result
+        last_valid_result = stream_model(xml, Details, chunk_size)
 
         assert last_valid_result is not None
+        validate_json_serializable(last_valid_result)
         assert isinstance(last_valid_result, Details)
         assert len(last_valid_result.birth_date.split("-")) == 3
 
 
-class ChunkInfo(BaseModel):
-    file_path: str = Field(..., description="The path of the file")
-    content: str = Field(..., description="The content of the chunk")
-
-
 class SearchResult(BaseModel):
     chunk_id: str = Field(..., description="The id of the chunk")
     chunk_info: ChunkInfo = Field(..., description="The info of the chunk")
@@ -426,6 +435,7 @@ class TestSearch:
         search_file: str = load_test_file("search.xml")
         parsed = parse_xml(search_file, SearchResponse)
         validate_parsed_model(parsed, SearchResponse)
+        validate_json_serializable(parsed)
 
         # Validate specific fields
         assert parsed.objective, "Objective should not be empty"
@@ -438,22 +448,53 @@ class TestSearch:
             assert result.chunk_info.file_path, "File path should not be empty"
             assert result.chunk_info.content, "Content should not be empty"
 
-    def test_search_response_streaming(self):
+    @pytest.mark.slow
+    @pytest.mark.parametrize("chunk_size", STREAMING_CHUNK_SIZES)
+    def test_search_response_streaming(self, chunk_size: int):
         search_file: str = load_test_file("search.xml")
-        partial_content = ""
-        last_valid_result = None
-        for char in search_file:
-            partial_content += char
-            result = parse_xml(partial_content, SearchResponse)
-            validate_parsed_model(result, SearchResponse)
-            last_valid_result = result
+        last_valid_result = stream_model(search_file, SearchResponse, chunk_size)
 
         assert last_valid_result is not None
+        validate_json_serializable(last_valid_result)
         assert isinstance(last_valid_result, SearchResponse)
         assert last_valid_result.objective
         assert len(last_valid_result.search_results) > 0
 
 
+class TestIncrementalParser:
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        ("xml", "model_class"),
+        [
+            (load_test_file("basic_response.xml"), BasicResponse),
+            (load_test_file("enum_nested.xml"), EnumSearchResponse),
+            (load_test_file("search.xml"), SearchResponse),
+            (MOVIES_XML, ResponseObject),
+            (load_test_file("details.xml"), Details),
+            (load_test_file("complete.xml"), CodeAction),
+            (load_test_file("streaming.xml"), CodeAction),
+        ],
+        ids=[
+            "basic",
+            "enum_search",
+            "search",
+            "movies",
+            "details",
+            "complete",
+            "streaming",
+        ],
+    )
+    def test_incremental_parser_matches_parse_xml(
+        self, xml: str, model_class: Type[T]
+    ):
+        # Every prefix, mid-text ones included, must match a one-shot parse
+        xml += "\nDone."
+        parser = IncrementalParser(model_class)
+        for end, char in enumerate(xml, start=1):
+            parser.feed(char)
+            assert parser.current_model() == parse_xml(xml[:end], model_class)
+
+
 if __name__ == "__main__":
     import pytest
 
@@ -1,8 +1,16 @@
-from typing import List, Literal, Union
+from enum import IntEnum
+from typing import Annotated, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+import pytest
+from pydantic import BaseModel, Field, create_model
 
-from llmxml.prompting import generate_example, generate_prompt_template
+from llmxml.prompting import (
+    _TEMPLATE_CACHE,
+    PromptedModel,
+    generate_example,
+    generate_prompt_template,
+    iter_prompt_template,
+)
 
 
 class CreateAction(BaseModel):
@@ -101,6 +109,92 @@ def test_empty_model():
     assert result == ""
 
 
+def test_list_item_tag_is_snake_case():
+    """Test list item tags use the same snake_case names as the parser."""
+
+    class SearchResult(BaseModel):
+        chunk_id: str = Field(..., description="The id of the chunk")
+
+    class SearchResponse(BaseModel):
+        search_results: list[SearchResult] = Field(..., description="The results")
+
+    result = generate_prompt_template(SearchResponse, include_instructions=False)
+    assert "<search_result>" in result
+    assert "</search_result>" in result
+
+
+def test_prompted_model_renders_at_definition():
+    """Test PromptedModel subclasses have their template rendered when defined."""
+
+    class Prompted(PromptedModel):
+        name: str = Field(..., description="The name")
+
+    assert Prompted in _TEMPLATE_CACHE
+    assert generate_prompt_template(Prompted, include_instructions=False) == (
+        "<name>\n[type: str]\n[required]\n[The name]\n</name>"
+    )
+
+
+def test_pep604_union_list_type_info():
+    """Test list[X | Y] is described the same way as list[Union[X, Y]]."""
+
+    class PipeUnionActions(BaseModel):
+        actions: list[CreateAction | EditAction] = Field(
+            ..., description="The actions to perform"
+        )
+
+    result = generate_prompt_template(PipeUnionActions, include_instructions=False)
+    assert "[type: list of 'CreateAction', 'EditAction']" in result
+    assert "# Option 1: CreateAction" in result
+
+
+def test_iter_prompt_template_matches_prompt():
+    """Test the streamed template joins to the same string as the full prompt."""
+    for include_instructions in (True, False):
+        streamed = "".join(iter_prompt_template(Action, include_instructions))
+        assert streamed == generate_prompt_template(Action, include_instructions)
+
+
+@pytest.mark.parametrize("reordered_field", ["reordered_actions", "actions"])
+def test_union_options_follow_member_order(reordered_field: str):
+    """Test reordered unions render their options in their own order, also when the
+    rest of the field definition is the same."""
+    ab = create_model("AB", actions=(list[Union[CreateAction, EditAction]], ...))
+    ba = create_model(
+        "BA", **{reordered_field: (list[Union[EditAction, CreateAction]], ...)}
+    )
+
+    assert "# Option 1: CreateAction" in generate_prompt_template(ab)
+    assert "# Option 1: EditAction" in generate_prompt_template(ba)
+
+
+def test_type_info_follows_argument_order():
+    """Test reordered unions and Literals keep their own type information."""
+
+    class IntStr(BaseModel):
+        value: Union[int, str]
+        mode: Literal["x", "y"]
+
+    class StrInt(BaseModel):
+        value: Union[str, int]
+        mode: Literal["y", "x"]
+
+    assert "[type: int | str]" in generate_prompt_template(IntStr)
+    assert "[type: Literal[x, y]]" in generate_prompt_template(IntStr)
+    assert "[type: str | int]" in generate_prompt_template(StrInt)
+    assert "[type: Literal[y, x]]" in generate_prompt_template(StrInt)
+
+
+def test_unhashable_annotated_metadata():
+    """Test prompts render fields whose Annotated metadata cannot be hashed."""
+
+    class Tagged(BaseModel):
+        nums: list[Annotated[int, {"k": [1]}]]
+
+    prompt = generate_prompt_template(Tagged, include_instructions=False)
+    assert "<nums>\n[type: list]\n[required]" in prompt
+
+
 def test_optional_fields():
     """Test prompt generation for a model with optional fields."""
 
@@ -136,5 +230,48 @@ def test_example_generation():
     assert generated_example != ""
 
 
+def test_example_falsy_enum_member():
+    """Test Enum members with falsy values still render their value."""
+
+    class Level(IntEnum):
+        OFF = 0
+        ON = 1
+
+    class Switch(BaseModel):
+        level: Level
+        history: list[Level]
+
+    example = generate_example(Switch(level=Level.OFF, history=[Level.OFF, Level.ON]))
+    assert example == (
+        "<switch>\n<level>0</level>\n<history>0</history>\n<history>1</history>\n</switch>"
+    )
+
+
+def test_example_unhashable_annotated_metadata():
+    """Test examples render fields whose Annotated metadata cannot be hashed."""
+
+    class Tagged(BaseModel):
+        nums: list[Annotated[int, {"k": [1]}]]
+
+    example = generate_example(Tagged(nums=[1, 2]))
+    assert example == "<tagged>\n<nums>1</nums>\n<nums>2</nums>\n</tagged>"
+
+
+def test_example_optional_literal():
+    """Test an Optional[Literal] field renders in flat models and next to nested fields."""
+
+    class Flat(BaseModel):
+        mode: Optional[Literal["a", "b"]] = None
+
+    class Mixed(BaseModel):
+        mode: Optional[Literal["a", "b"]] = None
+        tags: list[str] = []
+
+    assert generate_example(Flat(mode="a")) == "<flat>\n<mode>a</mode>\n</flat>"
+    assert generate_example(Mixed(mode="b", tags=["x"])) == (
+        "<mixed>\n<mode>b</mode>\n<tags>x</tags>\n</mixed>"
+    )
+
+
 if __name__ == "__main__":
     test_optional_fields()